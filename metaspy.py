@@ -4,200 +4,816 @@ import argparse
 import os
 import json
 import csv
-from datetime import datetime
+import hashlib
+import mmap
+import re
+import sqlite3
+import stat
+import zipfile
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from operator import itemgetter
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib json encoder
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # optional: worker results are pickled instead
+    msgspec = None
+
+# Extraction libraries (pypdf, exiftool) are imported inside the functions
+# that need them so a run only pays for the file types it actually sees.
+
+# --- Minimal PDF Info Reader ---
+#
+# Reading the Info dictionary only needs the trailer, the xref entry for
+# the Info object and that object itself. Anything this reader does not
+# understand (xref streams, encryption, indirect values, damaged files)
+# raises ValueError/IndexError so the caller can fall back to pypdf.
+
+class _PdfParseError(ValueError):
+    """Raised when the fast PDF reader meets a layout it does not handle."""
+
+_PDF_WHITESPACE = b'\x00\t\n\x0c\r '
+_PDF_TOKEN_RE = re.compile(rb'[^\x00\t\n\x0c\r ()<>\[\]{}/%]+')
+_PDF_REF_TAIL_RE = re.compile(rb'\s+(\d+)\s+R(?![^\x00\t\n\x0c\r ()<>\[\]{}/%])')
+_PDF_XREF_SUBSECTION_RE = re.compile(rb'\s*(\d+)\s+(\d+)')
+_PDF_XREF_ENTRY_RE = re.compile(rb'\s*(\d+)\s+(\d+)\s+([nf])')
+_PDF_OBJ_HEADER_RE = re.compile(rb'\s*(\d+)\s+(\d+)\s+obj\s*<<')
+_PDF_INFO_REF_RE = re.compile(rb'/Info\s+(\d+)\s+(\d+)\s+R')
+_PDF_PREV_RE = re.compile(rb'/Prev\s+(\d+)')
+# Each field is only allowed after the previous one, and a UTC offset only
+# after the seconds, so nothing is accepted that pypdf would reject.
+_PDF_DATE_RE = re.compile(
+    r"(?:D:)?(\d{4})(?:(\d{2})(?:(\d{2})(?:(\d{2})(?:(\d{2})(?:(\d{2})"
+    r"(?:([Zz+-])(?:(\d{2})'?(?:(\d{2})'?)?)?)?)?)?)?)?)?"
+)
+_PDF_ESCAPES = {
+    ord('n'): b'\n', ord('r'): b'\r', ord('t'): b'\t', ord('b'): b'\b', ord('f'): b'\f',
+    ord('('): b'(', ord(')'): b')', ord('\\'): b'\\',
+}
+# PDFDocEncoding matches Latin-1 except for these code points.
+_PDF_DOC_ENCODING = {
+    0x80: '\u2022', 0x81: '\u2020', 0x82: '\u2021', 0x83: '\u2026', 0x84: '\u2014',
+    0x85: '\u2013', 0x86: '\u0192', 0x87: '\u2044', 0x88: '\u2039', 0x89: '\u203a',
+    0x8a: '\u2212', 0x8b: '\u2030', 0x8c: '\u201e', 0x8d: '\u201c', 0x8e: '\u201d',
+    0x8f: '\u2018', 0x90: '\u2019', 0x91: '\u201a', 0x92: '\u2122', 0x93: '\ufb01',
+    0x94: '\ufb02', 0x95: '\u0141', 0x96: '\u0152', 0x97: '\u0160', 0x98: '\u0178',
+    0x99: '\u017d', 0x9a: '\u0131', 0x9b: '\u0142', 0x9c: '\u0153', 0x9d: '\u0161',
+    0x9e: '\u017e', 0xa0: '\u20ac',
+}
+# Placeholder for direct values the reader skips rather than decodes.
+_PDF_SKIPPED = object()
+_PDF_INFO_KEYS = (b'Title', b'Author', b'Creator', b'Producer', b'CreationDate', b'ModDate')
+
+def _pdf_skip_whitespace(buf, pos):
+    """Advances past whitespace and comments."""
+    while pos < len(buf):
+        char = buf[pos:pos + 1]
+        if char == b'%':
+            while pos < len(buf) and buf[pos:pos + 1] not in b'\r\n':
+                pos += 1
+        elif char in _PDF_WHITESPACE:
+            pos += 1
+        else:
+            break
+    return pos
+
+def _pdf_parse_literal_string(buf, pos):
+    """Parses a (literal string) starting at the opening parenthesis."""
+    out = bytearray()
+    depth = 1
+    pos += 1
+    while True:
+        char = buf[pos]
+        pos += 1
+        if char == 0x5c:  # backslash
+            char = buf[pos]
+            pos += 1
+            if char in _PDF_ESCAPES:
+                out += _PDF_ESCAPES[char]
+            elif 0x30 <= char <= 0x37:
+                digits = bytes([char])
+                while len(digits) < 3 and 0x30 <= buf[pos] <= 0x37:
+                    digits += buf[pos:pos + 1]
+                    pos += 1
+                out.append(int(digits, 8) & 0xff)
+            elif char == 0x0d:  # line continuation
+                if buf[pos] == 0x0a:
+                    pos += 1
+            elif char != 0x0a:
+                out.append(char)
+        elif char == 0x28:
+            depth += 1
+            out.append(char)
+        elif char == 0x29:
+            depth -= 1
+            if depth == 0:
+                return bytes(out), pos
+            out.append(char)
+        elif char == 0x0d:
+            if buf[pos] == 0x0a:
+                pos += 1
+            out.append(0x0a)
+        else:
+            out.append(char)
+
+def _pdf_parse_value(buf, pos):
+    """Parses one object at pos and returns (value, new_pos).
+
+    Strings come back as bytes, indirect references as ('ref', num, gen);
+    names, numbers, booleans, null, arrays and dictionaries are skipped and
+    returned as _PDF_SKIPPED, so they are not mistaken for a missing key.
+    """
+    pos = _pdf_skip_whitespace(buf, pos)
+    char = buf[pos:pos + 1]
+    if char == b'(':
+        return _pdf_parse_literal_string(buf, pos)
+    if buf[pos:pos + 2] == b'<<':
+        return _PDF_SKIPPED, _pdf_parse_dict(buf, pos + 2, None)[1]
+    if char == b'<':
+        end = buf.find(b'>', pos)
+        if end < 0:
+            raise _PdfParseError("unterminated hex string")
+        hex_digits = bytes(buf[pos + 1:end]).translate(None, _PDF_WHITESPACE)
+        if len(hex_digits) % 2:
+            hex_digits += b'0'
+        return bytes.fromhex(hex_digits.decode('ascii')), end + 1
+    if char == b'[':
+        pos += 1
+        while True:
+            pos = _pdf_skip_whitespace(buf, pos)
+            if buf[pos:pos + 1] == b']':
+                return _PDF_SKIPPED, pos + 1
+            _, pos = _pdf_parse_value(buf, pos)
+    if char == b'/':
+        pos += 1
+    match = _PDF_TOKEN_RE.match(buf, pos)
+    if not match:
+        raise _PdfParseError(f"unexpected byte {char!r} at offset {pos}")
+    if char != b'/' and match.group().isdigit():
+        ref = _PDF_REF_TAIL_RE.match(buf, match.end())
+        if ref:
+            return ('ref', int(match.group()), int(ref.group(1))), ref.end()
+    return _PDF_SKIPPED, match.end()
+
+def _pdf_parse_dict(buf, pos, wanted):
+    """Parses dictionary entries after '<<', keeping only the keys in wanted."""
+    values = {}
+    while True:
+        pos = _pdf_skip_whitespace(buf, pos)
+        if buf[pos:pos + 2] == b'>>':
+            return values, pos + 2
+        if buf[pos:pos + 1] != b'/':
+            raise _PdfParseError(f"expected a name at offset {pos}")
+        key = _PDF_TOKEN_RE.match(buf, pos + 1)
+        if not key:
+            raise _PdfParseError(f"empty name at offset {pos}")
+        value, pos = _pdf_parse_value(buf, key.end())
+        if wanted is not None and key.group() in wanted:
+            values[key.group()] = value
+
+def _pdf_read_xref_table(buf, offset, entries):
+    """Reads a classic xref table at offset and returns its trailer bytes.
+
+    Entries already present in `entries` are kept, so newer sections win.
+    """
+    pos = _pdf_skip_whitespace(buf, offset)
+    if buf[pos:pos + 4] != b'xref':
+        raise _PdfParseError("xref streams are not supported")
+    pos += 4
+    while True:
+        pos = _pdf_skip_whitespace(buf, pos)
+        if buf[pos:pos + 7] == b'trailer':
+            break
+        subsection = _PDF_XREF_SUBSECTION_RE.match(buf, pos)
+        if not subsection:
+            raise _PdfParseError(f"malformed xref subsection at offset {pos}")
+        first, count = int(subsection.group(1)), int(subsection.group(2))
+        pos = subsection.end()
+        for num in range(first, first + count):
+            entry = _PDF_XREF_ENTRY_RE.match(buf, pos)
+            if not entry:
+                raise _PdfParseError(f"malformed xref entry at offset {pos}")
+            if entry.group(3) == b'n':
+                entries.setdefault(num, (int(entry.group(1)), int(entry.group(2))))
+            pos = entry.end()
+    end = buf.find(b'startxref', pos)
+    return bytes(buf[pos:end if end >= 0 else len(buf)])
+
+def _pdf_decode_text(raw):
+    """Decodes a PDF text string (UTF-16BE, UTF-8 or PDFDocEncoding)."""
+    if raw.startswith(b'\xfe\xff'):
+        return raw[2:].decode('utf-16-be', errors='replace')
+    if raw.startswith(b'\xef\xbb\xbf'):
+        return raw[3:].decode('utf-8', errors='replace')
+    return raw.decode('latin-1').translate(_PDF_DOC_ENCODING)
+
+def _pdf_parse_date(text):
+    """Parses a PDF date string such as D:20240131120000+01'00'."""
+    match = _PDF_DATE_RE.fullmatch(text)
+    if not match:
+        raise _PdfParseError(f"unrecognised date {text!r}")
+    year, month, day, hour, minute, second, sign, tz_hour, tz_minute = match.groups()
+    tzinfo = None
+    if sign in ('Z', 'z') and not tz_hour:
+        tzinfo = timezone.utc
+    elif sign:
+        delta = timedelta(hours=int(tz_hour or 0), minutes=int(tz_minute or 0))
+        tzinfo = timezone(-delta if sign == '-' else delta)
+    return datetime(
+        int(year), int(month or 1), int(day or 1),
+        int(hour or 0), int(minute or 0), int(second or 0), tzinfo=tzinfo,
+    )
+
+def _read_pdf_info_fast(buf):
+    """Reads the Info dictionary of a PDF held in buf without parsing the document.
+
+    Returns a dict keyed by Info entry name (Title, Author, ..., ModDate),
+    with dates already converted to datetime objects.
+    """
+    startxref = buf.rfind(b'startxref', max(0, len(buf) - 8192))
+    if startxref < 0:
+        raise _PdfParseError("startxref not found")
+    offset = _PDF_TOKEN_RE.match(buf, _pdf_skip_whitespace(buf, startxref + 9))
+    if not offset or not offset.group().isdigit():
+        raise _PdfParseError("startxref offset missing")
+    offset = int(offset.group())
+
+    # Like pypdf, walk the whole /Prev chain and merge the trailers: a key an
+    # update leaves out is inherited from an older trailer (the newest value
+    # wins), and /Encrypt anywhere in the chain means the strings are encrypted.
+    entries = {}
+    info_ref = None
+    seen = set()
+    while offset is not None and offset not in seen:
+        seen.add(offset)
+        trailer = _pdf_read_xref_table(buf, offset, entries)
+        if b'/Encrypt' in trailer:
+            raise _PdfParseError("encrypted documents are not supported")
+        if info_ref is None:
+            match = _PDF_INFO_REF_RE.search(trailer)
+            if match:
+                info_ref = (int(match.group(1)), int(match.group(2)))
+        prev = _PDF_PREV_RE.search(trailer)
+        offset = int(prev.group(1)) if prev else None
+
+    if info_ref is None:
+        return {key.decode(): None for key in _PDF_INFO_KEYS}
+    if entries.get(info_ref[0], (None, None))[1] != info_ref[1]:
+        raise _PdfParseError("Info object not found in xref table")
+    header = _PDF_OBJ_HEADER_RE.match(buf, entries[info_ref[0]][0])
+    if not header or (int(header.group(1)), int(header.group(2))) != info_ref:
+        raise _PdfParseError("xref offset does not point at the Info object")
+
+    raw_values, _ = _pdf_parse_dict(buf, header.end(), _PDF_INFO_KEYS)
+    info = {}
+    for key in _PDF_INFO_KEYS:
+        raw = raw_values.get(key)
+        if raw is not None and not isinstance(raw, bytes):
+            raise _PdfParseError(f"/{key.decode()} is not a direct string")
+        text = _pdf_decode_text(raw) if raw is not None else None
+        if text is not None and key in (b'CreationDate', b'ModDate'):
+            text = _pdf_parse_date(text)
+        info[key.decode()] = text
+    return info
+
+def _plain_str(value):
+    """Converts a str subclass (or any non-None value) into a plain str."""
+    return None if value is None else str(value)
+
+def _read_pdf_info_pypdf(stream):
+    """Reads the Info dictionary with pypdf, in the same shape as _read_pdf_info_fast."""
+    from pypdf import PdfReader
+
+    info = PdfReader(stream).metadata
+    if info is None:
+        return {key.decode(): None for key in _PDF_INFO_KEYS}
+    # pypdf string objects can hold references back to the reader, so
+    # copy them into plain str before they cross a process boundary.
+    return {
+        "Title": _plain_str(info.title),
+        "Author": _plain_str(info.author),
+        "Creator": _plain_str(info.creator),
+        "Producer": _plain_str(info.producer),
+        "CreationDate": info.creation_date,
+        "ModDate": info.modification_date,
+    }
+
+
+# --- OOXML Core Properties Reader ---
+#
+# DOCX, PPTX and XLSX files are zip archives that keep their document
+# properties in docProps/core.xml, so there is no need to load the
+# document, presentation or workbook itself.
+
+_OOXML_NS = {
+    'cp': 'http://schemas.openxmlformats.org/package/2006/metadata/core-properties',
+    'dc': 'http://purl.org/dc/elements/1.1/',
+    'dcterms': 'http://purl.org/dc/terms/',
+}
+_DC = f"{{{_OOXML_NS['dc']}}}"
+_CP = f"{{{_OOXML_NS['cp']}}}"
+_DCTERMS = f"{{{_OOXML_NS['dcterms']}}}"
+
+_W3CDTF_TEMPLATES = ('%Y-%m-%dT%H:%M:%S', '%Y-%m-%d', '%Y-%m', '%Y')
+_W3CDTF_OFFSET = re.compile(r'([+-])(\d\d):(\d\d)')
+
+def _parse_w3cdtf(text, apply_offset=True):
+    """Parses a W3CDTF timestamp (2024, 2024-01-31, 2024-01-31T12:00:00-08:00, ...), or returns None.
+
+    Follows python-docx: the first 19 characters are parsed and a trailing
+    +HH:MM / -HH:MM offset is folded in, giving a naive UTC datetime.
+    openpyxl ignored the offset, so XLSX dates pass apply_offset=False.
+    """
+    if not text:
+        return None
+    parseable, offset = text[:19], text[19:]
+    for template in _W3CDTF_TEMPLATES:
+        try:
+            dt = datetime.strptime(parseable, template)
+            break
+        except ValueError:
+            continue
+    else:
+        return None
+    if apply_offset and len(offset) == 6:
+        match = _W3CDTF_OFFSET.match(offset)
+        if match is None:
+            return None
+        sign, hours, minutes = match.groups()
+        delta = timedelta(hours=int(hours), minutes=int(minutes))
+        dt = dt - delta if sign == '+' else dt + delta
+    return dt
+
+def _parse_revision(text):
+    """Parses the cp:revision property, which should be a positive integer."""
+    try:
+        return max(int(text), 0)
+    except (TypeError, ValueError):
+        return 0
+
+# Converters applied to each core.xml text value (None when the property is absent).
+
+def _ooxml_text(text):
+    """Text property, '' when absent (python-docx / python-pptx convention)."""
+    return text or ''
+
+def _ooxml_optional_text(text):
+    """Text property, None when absent (openpyxl convention)."""
+    return text
+
+def _ooxml_datetime(text):
+    """W3CDTF timestamp formatted for the report."""
+    return _fmt_datetime(_parse_w3cdtf(text))
+
+def _ooxml_workbook_datetime(text):
+    """W3CDTF timestamp formatted for the report, UTC offset ignored (openpyxl convention)."""
+    return _fmt_datetime(_parse_w3cdtf(text, apply_offset=False))
+
+# (report field, qualified core.xml tag, converter) in report order. Each file
+# type keeps the labels and defaults of the library that used to read it.
+_OOXML_DOCUMENT_FIELDS = (
+    ("Author", _DC + "creator", _ooxml_text),
+    ("Last Modified By", _CP + "lastModifiedBy", _ooxml_text),
+    ("Revision", _CP + "revision", _parse_revision),
+    ("Created", _DCTERMS + "created", _ooxml_datetime),
+    ("Modified", _DCTERMS + "modified", _ooxml_datetime),
+    ("Title", _DC + "title", _ooxml_text),
+    ("Subject", _DC + "subject", _ooxml_text),
+)
+_OOXML_WORKBOOK_FIELDS = (
+    ("Creator", _DC + "creator", _ooxml_optional_text),
+    ("Last Modified By", _CP + "lastModifiedBy", _ooxml_optional_text),
+    ("Created", _DCTERMS + "created", _ooxml_workbook_datetime),
+    ("Modified", _DCTERMS + "modified", _ooxml_workbook_datetime),
+    ("Title", _DC + "title", _ooxml_optional_text),
+    ("Subject", _DC + "subject", _ooxml_optional_text),
+)
 
-# Import extraction libraries
-from pypdf import PdfReader
-import docx
-import exiftool
-from pptx import Presentation
-from openpyxl import load_workbook
 
 # --- Metadata Extraction Functions ---
 
+def _fmt_datetime(dt):
+    """Formats a datetime as 'YYYY-MM-DD HH:MM:SS' (any UTC offset is dropped), passing None through."""
+    return dt and dt.replace(tzinfo=None).isoformat(sep=' ', timespec='seconds')
+
 def extract_pdf_metadata(file_path):
     """Extracts metadata from a PDF file."""
     try:
         with open(file_path, 'rb') as f:
-            reader = PdfReader(f)
-            info = reader.metadata
-            creation_date = info.creation_date
-            mod_date = info.modification_date
-            return {
-                "File Type": "PDF",
-                "Title": info.title,
-                "Author": info.author,
-                "Creator": info.creator,
-                "Producer": info.producer,
-                "Creation Date": creation_date.strftime("%Y-%m-%d %H:%M:%S") if creation_date else None,
-                "Modification Date": mod_date.strftime("%Y-%m-%d %H:%M:%S") if mod_date else None,
-            }
-    except Exception as e:
+            if os.fstat(f.fileno()).st_size == 0:
+                return {"Error": "Could not process PDF: Cannot read an empty file"}
+            # The fast reader only touches the trailer/xref regions; mapping the
+            # file lets the kernel page in just those instead of copying through read().
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    info = _read_pdf_info_fast(mm)
+            except (ValueError, IndexError):
+                # Layouts the fast reader does not handle (or damaged files) go through
+                # pypdf, on the real file object so its seek-past-EOF xref recovery works.
+                from pypdf.errors import PyPdfError
+                f.seek(0)
+                try:
+                    info = _read_pdf_info_pypdf(f)
+                except (PyPdfError, ValueError) as e:
+                    # pypdf reports malformed /CreationDate and /ModDate values as ValueError.
+                    return {"Error": f"Could not process PDF: {e}"}
+    except OSError as e:
         return {"Error": f"Could not process PDF: {e}"}
+    return {
+        "File Type": "PDF",
+        "Title": info["Title"],
+        "Author": info["Author"],
+        "Creator": info["Creator"],
+        "Producer": info["Producer"],
+        "Creation Date": _fmt_datetime(info["CreationDate"]),
+        "Modification Date": _fmt_datetime(info["ModDate"]),
+    }
 
 
-def extract_docx_metadata(file_path):
-    """Extracts metadata from a DOCX file."""
+def _extract_ooxml_core_props(file_path, file_type_label, fields):
+    """Extracts metadata from an Office Open XML file (DOCX, PPTX or XLSX).
+
+    fields is one of the _OOXML_*_FIELDS tables and decides the report
+    labels, their order and the values used for missing properties.
+    """
+    wanted = {tag for _, tag, _ in fields}
+    texts = {}
     try:
-        doc = docx.Document(file_path)
-        props = doc.core_properties
-        return {
-            "File Type": "DOCX",
-            "Author": props.author,
-            "Last Modified By": props.last_modified_by,
-            "Revision": props.revision,
-            "Created": props.created.strftime("%Y-%m-%d %H:%M:%S") if props.created else None,
-            "Modified": props.modified.strftime("%Y-%m-%d %H:%M:%S") if props.modified else None,
-            "Title": props.title,
-            "Subject": props.subject,
-        }
-    except Exception as e:
-        return {"Error": f"Could not process DOCX: {e}"}
+        with zipfile.ZipFile(file_path) as z:
+            if 'docProps/core.xml' in z.namelist():
+                with z.open('docProps/core.xml') as core:
+                    for _, element in ET.iterparse(core):
+                        if element.tag in wanted and element.text:
+                            texts[element.tag] = element.text
+    except (OSError, zipfile.BadZipFile, ET.ParseError) as e:
+        return {"Error": f"Could not process {file_type_label}: {e}"}
+    metadata = {"File Type": file_type_label}
+    for field, tag, convert in fields:
+        metadata[field] = convert(texts.get(tag))
+    return metadata
+
+def _clean_exiftool_metadata(metadata):
+    """Strips the ExifTool group prefix (e.g. 'EXIF:') from every tag name."""
+    return {key.rpartition(':')[2] or key: value for key, value in metadata.items()}
+
+def _exiftool_single(et, file_path):
+    """Extracts metadata for one image using an already running ExifTool process."""
+    from exiftool.exceptions import ExifToolException
 
-def extract_exiftool_metadata(file_path):
-    """Extracts all possible metadata from an image using ExifTool."""
     try:
-        with exiftool.ExifToolHelper() as et:
-            metadata = et.get_metadata(file_path)[0] 
-            cleaned_metadata = {key.split(':')[-1]: value for key, value in metadata.items()}
-            return cleaned_metadata
-    except Exception as e:
+        return _clean_exiftool_metadata(et.get_metadata(file_path)[0])
+    except ExifToolException as e:
         return {"Error": f"Could not process image with ExifTool: {e}"}
 
-def extract_pptx_metadata(file_path):
-    """Extracts metadata from a PPTX file."""
-    try:
-        prs = Presentation(file_path)
-        props = prs.core_properties
-        return {
-            "File Type": "PPTX",
-            "Author": props.author,
-            "Last Modified By": props.last_modified_by,
-            "Revision": props.revision,
-            "Created": props.created.strftime("%Y-%m-%d %H:%M:%S") if props.created else None,
-            "Modified": props.modified.strftime("%Y-%m-%d %H:%M:%S") if props.modified else None,
-            "Title": props.title,
-            "Subject": props.subject,
-        }
-    except Exception as e:
-        return {"Error": f"Could not process PPTX: {e}"}
+def extract_exiftool_metadata_batch(file_paths):
+    """Extracts metadata from many images with a single ExifTool process.
+
+    Returns one metadata dict per path, in the same order as file_paths.
+    """
+    import exiftool
+    from exiftool.exceptions import ExifToolException
 
-def extract_xlsx_metadata(file_path):
-    """Extracts metadata from an XLSX file."""
     try:
-        wb = load_workbook(file_path)
-        props = wb.properties
-        return {
-            "File Type": "XLSX",
-            "Creator": props.creator,
-            "Last Modified By": props.lastModifiedBy,
-            "Created": props.created.strftime("%Y-%m-%d %H:%M:%S") if props.created else None,
-            "Modified": props.modified.strftime("%Y-%m-%d %H:%M:%S") if props.modified else None,
-            "Title": props.title,
-            "Subject": props.subject,
-        }
-    except Exception as e:
-        return {"Error": f"Could not process XLSX: {e}"}
+        with exiftool.ExifToolHelper() as et:
+            try:
+                return [_clean_exiftool_metadata(metadata) for metadata in et.get_metadata(file_paths)]
+            except ExifToolException:
+                # One unreadable image fails the whole batch; retry one by one
+                # on the same process so only the bad file reports an error.
+                return [_exiftool_single(et, file_path) for file_path in file_paths]
+    except (OSError, ExifToolException) as e:
+        return [{"Error": f"Could not process image with ExifTool: {e}"} for _ in file_paths]
+
+def extract_exiftool_metadata(file_path):
+    """Extracts all possible metadata from an image using ExifTool."""
+    return extract_exiftool_metadata_batch([file_path])[0]
 
 # --- Output Generation Functions (Corrected) ---
 
 def save_as_txt(data, filename):
     """Saves extracted metadata to a TXT file."""
-    with open(filename, 'w', encoding='utf-8') as f:
+    with open(filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
         for item in data:
-            f.write(f"--- Metadata for: {item['file']} ---\n")
-            for key, value in item['metadata'].items():
-                f.write(f"{key}: {value}\n")
+            lines = [f"--- Metadata for: {item['file']} ---\n"]
+            lines.extend(f"{key}: {value}\n" for key, value in item['metadata'].items())
             if 'Geolocation' in item:
-                f.write(f"Geolocation: {item['Geolocation']}\n")
-            f.write("\n")
+                lines.append(f"Geolocation: {item['Geolocation']}\n")
+            lines.append("\n")
+            f.writelines(lines)
     print(f"✅ Report saved to {filename}")
 
+def _dumps_json(data):
+    """Encodes data as indented JSON bytes, using orjson when it is installed.
+
+    Both encoders are configured to produce the same bytes (2-space indent,
+    raw UTF-8, unknown types and datetimes via str), so a report does not
+    depend on whether the optional package is present.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME
+        )
+    return json.dumps(data, indent=2, ensure_ascii=False, default=str).encode('utf-8')
+
 def save_as_json(data, filename):
     """Saves extracted metadata to a JSON file."""
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=4)
+    with open(filename, 'wb') as f:
+        f.write(_dumps_json(data))
     print(f"✅ Report saved to {filename}")
 
+def _csv_keys(item):
+    """Returns the CSV columns an item contributes."""
+    keys = {'File', *item['metadata']}
+    if 'Geolocation' in item:
+        keys.add('Geolocation')
+    return keys
+
+def _csv_row(item, headers):
+    """Flattens a report item into a list of cells, one per header."""
+    metadata = item['metadata']
+    extras = {'File': item['file'], 'Geolocation': item.get('Geolocation', '')}
+    return [metadata[header] if header in metadata else extras.get(header, '') for header in headers]
+
 def save_as_csv(data, filename):
-    """Saves extracted metadata to a CSV file."""
+    """Saves extracted metadata to a CSV file.
+
+    The header row is the union of every item's keys, found in one pass over
+    the metadata; rows are then flattened one at a time as they are written.
+    """
     with open(filename, 'w', newline='', encoding='utf-8') as f:
-        flat_data = []
-        for item in data:
-            base_info = {'File': item['file']}
-            if 'Geolocation' in item:
-                base_info['Geolocation'] = item['Geolocation']
-            base_info.update(item['metadata'])
-            flat_data.append(base_info)
-        
-        if not flat_data:
+        if not data:
             print("⚠️ No data to write.")
             return
 
-        headers = sorted(list(set(key for d in flat_data for key in d.keys())))
-        writer = csv.DictWriter(f, fieldnames=headers)
-        writer.writeheader()
-        writer.writerows(flat_data)
+        headers = sorted(set().union(*map(_csv_keys, data)))
+        writer = csv.writer(f)
+        writer.writerow(headers)
+        writer.writerows(_csv_row(item, headers) for item in data)
     print(f"✅ Report saved to {filename}")
 
 
+# --- Metadata Cache ---
+
+CACHE_VERSION = 1
+CACHE_PATH = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'metaspy', 'cache.sqlite'
+)
+
+def open_cache(path=CACHE_PATH):
+    """Opens (creating if needed) the on-disk metadata cache.
+
+    The cache holds author names and GPS coordinates, so its directory and
+    database are created readable by the current user only.
+    """
+    os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+    os.close(os.open(path, os.O_CREAT | os.O_WRONLY, 0o600))
+    os.chmod(path, 0o600)
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE IF NOT EXISTS cache (key BLOB PRIMARY KEY, value TEXT NOT NULL)")
+    return conn
+
+def clear_cache(path=CACHE_PATH):
+    """Deletes the on-disk metadata cache along with any SQLite journal files."""
+    for leftover in (path, path + '-journal', path + '-wal', path + '-shm'):
+        try:
+            os.remove(leftover)
+        except FileNotFoundError:
+            pass
+
+def _cache_key(file_path, st):
+    """Builds a cache key that changes whenever the file is moved, modified or resized.
+
+    st is the file's os.stat_result, already collected while gathering inputs.
+    """
+    raw = f"{CACHE_VERSION}|{os.path.abspath(file_path)}|{st.st_mtime_ns}|{st.st_size}"
+    return hashlib.blake2b(raw.encode()).digest()
+
+def _cache_get(conn, key):
+    """Returns the cached metadata dict for key, or None on a miss.
+
+    A row that no longer decodes to a dict (e.g. a damaged cache file) is a
+    miss too, so the file is re-extracted and the row overwritten.
+    """
+    row = conn.execute("SELECT value FROM cache WHERE key = ?", (key,)).fetchone()
+    if row is None:
+        return None
+    try:
+        metadata = json.loads(row[0])
+    except (TypeError, ValueError):
+        return None
+    return metadata if isinstance(metadata, dict) else None
+
+def _cache_put(conn, key, metadata):
+    """Stores metadata under key. Failed extractions are not cached so they get retried."""
+    if 'Error' in metadata:
+        return
+    conn.execute(
+        "INSERT OR REPLACE INTO cache (key, value) VALUES (?, ?)",
+        (key, json.dumps(metadata, default=str)),
+    )
+
+
+# --- Dispatch ---
+
+# Extensions are stored lower-case and without the leading dot.
+IMAGE_EXTENSIONS = frozenset({'jpg', 'jpeg', 'png', 'tiff', 'gif', 'bmp'})
+
+FILE_HANDLERS = {
+    'pdf': extract_pdf_metadata,
+    'docx': partial(_extract_ooxml_core_props, file_type_label='DOCX', fields=_OOXML_DOCUMENT_FIELDS),
+    'pptx': partial(_extract_ooxml_core_props, file_type_label='PPTX', fields=_OOXML_DOCUMENT_FIELDS),
+    'xlsx': partial(_extract_ooxml_core_props, file_type_label='XLSX', fields=_OOXML_WORKBOOK_FIELDS),
+    **dict.fromkeys(IMAGE_EXTENSIONS, extract_exiftool_metadata),
+}
+
+OUTPUT_HANDLERS = {
+    'txt': save_as_txt,
+    'csv': save_as_csv,
+    'json': save_as_json,
+}
+
+def _file_extension(file_path):
+    """Returns the lower-case extension of file_path without the dot, or '' if it has none."""
+    _, dot, ext = file_path.rpartition('.')
+    return ext.lower() if dot else ''
+
+def _dispatch(file_path):
+    """Runs the matching extractor for a file in a worker process.
+
+    Kept at module level so it can be pickled into worker processes. When
+    msgspec is installed the item is returned as MessagePack bytes, which
+    cross the process boundary much faster than a pickled dict; pass the
+    result through _load_dispatch_result() in the parent.
+    """
+    item = _build_item(file_path, FILE_HANDLERS[_file_extension(file_path)](file_path))
+    if msgspec is not None:
+        return msgspec.msgpack.encode(item, enc_hook=str)
+    return item
+
+def _load_dispatch_result(result):
+    """Decodes a _dispatch() return value back into a report item."""
+    if msgspec is not None:
+        return msgspec.msgpack.decode(result, type=dict)
+    return result
+
+_gps_get = itemgetter('GPSLatitude', 'GPSLongitude')
+
+def _build_item(file_path, metadata):
+    """Wraps extracted metadata into a report item, adding a geolocation link if present."""
+    item = {"file": file_path, "metadata": metadata}
+
+    try:
+        lat, lon = _gps_get(metadata)
+    except (KeyError, TypeError):
+        pass
+    else:
+        item['Geolocation'] = f"https://www.google.com/maps/search/?api=1&query={lat},{lon}"
+    return item
+
+
 # --- Main Application Logic ---
 
+def _scan_directory(directory):
+    """Yields (path, stat_result) for every supported file below directory, in name order.
+
+    os.scandir reports each entry's type from the directory listing itself,
+    so only files with a supported extension cost a stat() call.
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+    except OSError as e:
+        print(f"⚠️ Warning: Could not read directory '{directory}': {e}")
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _scan_directory(entry.path)
+        elif entry.is_file() and _file_extension(entry.name) in FILE_HANDLERS:
+            try:
+                entry_st = entry.stat()
+            except OSError as e:
+                print(f"⚠️ Warning: Could not read '{entry.path}': {e}")
+                continue
+            yield entry.path, entry_st
+
+def _unexpected_error(e):
+    """Metadata recorded for a file whose extractor raised instead of returning an error."""
+    return {"Error": f"Unexpected error ({type(e).__name__}): {e}"}
+
+def _collect_document(file_path, get_result):
+    """Returns the report item for a document, given a callable producing its _dispatch() result."""
+    try:
+        return _load_dispatch_result(get_result())
+    except Exception as e:
+        return _build_item(file_path, _unexpected_error(e))
+
+def _extract_images(images, all_metadata):
+    """Extracts (index, path) images with one shared ExifTool process, slotting items into all_metadata."""
+    if not images:
+        return
+    try:
+        batch = extract_exiftool_metadata_batch([path for _, path in images])
+    except Exception as e:
+        batch = [_unexpected_error(e)] * len(images)
+    for (index, path), metadata in zip(images, batch):
+        all_metadata[index] = _build_item(path, metadata)
+
 def main():
     """Main function to parse arguments and orchestrate extraction."""
     parser = argparse.ArgumentParser(
         description="MetaSpy: A metadata extraction tool for various file types.",
         epilog="Example: python metaspy.py mydoc.docx myphoto.jpg mydata.xlsx -o json"
     )
-    parser.add_argument("files", nargs="+", help="One or more file paths to analyze.")
+    parser.add_argument(
+        "files", nargs="+",
+        help="One or more files to analyze. Directories are searched recursively for supported files."
+    )
     parser.add_argument(
         "--output", "-o", 
-        choices=["txt", "csv", "json", "print"], 
+        choices=[*OUTPUT_HANDLERS, "print"],
         default="print", 
         help="The format for the output report (default: print to console)."
     )
+    parser.add_argument("--no-cache", action="store_true", help="Do not read or write the metadata cache.")
+    parser.add_argument("--clear-cache", action="store_true", help="Delete the metadata cache before analyzing.")
     args = parser.parse_args()
 
-    file_handlers = {
-        '.pdf': extract_pdf_metadata,
-        '.docx': extract_docx_metadata,
-        '.jpg': extract_exiftool_metadata,
-        '.jpeg': extract_exiftool_metadata,
-        '.png': extract_exiftool_metadata,
-        '.tiff': extract_exiftool_metadata,
-        '.gif': extract_exiftool_metadata,
-        '.bmp': extract_exiftool_metadata,
-        '.pptx': extract_pptx_metadata,
-        '.xlsx': extract_xlsx_metadata,
-    }
-
     print("🕵️  Starting MetaSpy analysis (v1.3 with Office Suite Support)...")
-    all_metadata = []
+    pending = []
 
     for file_path in args.files:
-        if not os.path.exists(file_path):
+        try:
+            st = os.stat(file_path)
+        except OSError:
             print(f"❌ Error: File not found at '{file_path}'")
             continue
 
-        file_ext = os.path.splitext(file_path)[1].lower()
-        handler = file_handlers.get(file_ext)
+        if stat.S_ISDIR(st.st_mode):
+            for entry_path, entry_st in _scan_directory(file_path):
+                print(f"📄 Analyzing {entry_path}...")
+                pending.append((entry_path, _file_extension(entry_path) in IMAGE_EXTENSIONS, entry_st))
+            continue
 
-        if handler:
+        file_ext = _file_extension(file_path)
+        if file_ext in FILE_HANDLERS:
             print(f"📄 Analyzing {file_path}...")
-            metadata = handler(file_path)
-            item = {"file": file_path, "metadata": metadata}
-            
-            if 'GPSLatitude' in metadata and 'GPSLongitude' in metadata:
-                try:
-                    lat, lon = metadata['GPSLatitude'], metadata['GPSLongitude']
-                    maps_link = f"https://www.google.com/maps/search/?api=1&query={lat},{lon}"
-                    item['Geolocation'] = maps_link
-                except Exception:
-                    pass
-            all_metadata.append(item)
+            pending.append((file_path, file_ext in IMAGE_EXTENSIONS, st))
         else:
             print(f"⚠️ Warning: Unsupported file type for '{file_path}'. Skipping.")
 
+    if args.clear_cache:
+        try:
+            clear_cache()
+        except OSError as e:
+            print(f"⚠️ Warning: Could not clear the metadata cache ({e}).")
+    cache = None
+    if not args.no_cache:
+        try:
+            cache = open_cache()
+        except (OSError, sqlite3.Error) as e:
+            print(f"⚠️ Warning: Metadata cache unavailable ({e}). Continuing without it.")
+
+    # Results are slotted back by input position so reports stay deterministic.
+    all_metadata = [None] * len(pending)
+    cache_keys = {}
+    images, documents = [], []
+    for index, (path, is_image, st) in enumerate(pending):
+        if cache is not None:
+            cache_keys[index] = _cache_key(path, st)
+            try:
+                metadata = _cache_get(cache, cache_keys[index])
+            except sqlite3.Error as e:
+                print(f"⚠️ Warning: Metadata cache unavailable ({e}). Continuing without it.")
+                cache.close()
+                cache = None
+                metadata = None
+            if metadata is not None:
+                all_metadata[index] = _build_item(path, metadata)
+                continue
+        (images if is_image else documents).append((index, path))
+
+    if len(documents) > 1:
+        max_workers = min(os.cpu_count() or 1, len(documents))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(_dispatch, path): index for index, path in documents}
+            # The ExifTool batch runs here while the workers handle documents.
+            _extract_images(images, all_metadata)
+            for future in as_completed(futures):
+                index = futures[future]
+                all_metadata[index] = _collect_document(pending[index][0], future.result)
+    else:
+        # Starting worker processes costs more than extracting a single document.
+        _extract_images(images, all_metadata)
+        for index, path in documents:
+            all_metadata[index] = _collect_document(path, partial(_dispatch, path))
+
     if args.output == "print":
         for item in all_metadata:
             print(f"\n--- Metadata for: {item['file']} ---")
@@ -210,12 +826,22 @@ def main():
                     print(f"  📍 Geolocation Link: {item['Geolocation']}")
         print("\n✅ Analysis complete.")
     else:
-        output_handlers = { 'txt': save_as_txt, 'json': save_as_json, 'csv': save_as_csv }
-        output_function = output_handlers.get(args.output)
+        output_function = OUTPUT_HANDLERS.get(args.output)
         if output_function:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             output_filename = f"metaspy_report_{timestamp}.{args.output}"
             output_function(all_metadata, output_filename)
 
+    # Saved only once the report is out, and never fatal: another run may hold the lock.
+    if cache is not None:
+        try:
+            with cache:
+                for index, _ in images + documents:
+                    _cache_put(cache, cache_keys[index], all_metadata[index]['metadata'])
+        except sqlite3.Error as e:
+            print(f"⚠️ Warning: Metadata cache unavailable ({e}). Results were not cached.")
+        finally:
+            cache.close()
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,69 @@
+"""Checks the on-disk metadata cache."""
+
+import os
+import stat
+import sys
+
+import pytest
+
+import metaspy
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "metaspy" / "cache.sqlite")
+
+
+def test_round_trip_skips_errors(cache_path):
+    conn = metaspy.open_cache(cache_path)
+    with conn:
+        metaspy._cache_put(conn, b"ok", {"Title": "T", "Revision": 7})
+        metaspy._cache_put(conn, b"bad", {"Error": "Could not process PDF: boom"})
+    assert metaspy._cache_get(conn, b"ok") == {"Title": "T", "Revision": 7}
+    assert metaspy._cache_get(conn, b"bad") is None
+    conn.close()
+
+
+def test_key_changes_with_mtime_and_size(tmp_path):
+    path = tmp_path / "a.pdf"
+    path.write_bytes(b"one")
+    before = metaspy._cache_key(str(path), os.stat(path))
+    path.write_bytes(b"longer")
+    os.utime(path, ns=(0, 0))
+    assert metaspy._cache_key(str(path), os.stat(path)) != before
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permission bits")
+def test_cache_is_private_to_the_user(cache_path):
+    metaspy.open_cache(cache_path).close()
+    assert stat.S_IMODE(os.stat(os.path.dirname(cache_path)).st_mode) == 0o700
+    assert stat.S_IMODE(os.stat(cache_path).st_mode) == 0o600
+
+
+@pytest.mark.parametrize("stored", ["{not json", "", "[1, 2]", "null"])
+def test_undecodable_rows_are_misses(cache_path, stored):
+    conn = metaspy.open_cache(cache_path)
+    with conn:
+        conn.execute("INSERT INTO cache (key, value) VALUES (?, ?)", (b"k", stored))
+    assert metaspy._cache_get(conn, b"k") is None
+    conn.close()
+
+
+def test_clear_removes_journal_files(cache_path):
+    metaspy.open_cache(cache_path).close()
+    for suffix in ("-journal", "-wal", "-shm"):
+        open(cache_path + suffix, "w").close()
+    metaspy.clear_cache(cache_path)
+    assert os.listdir(os.path.dirname(cache_path)) == []
+    metaspy.clear_cache(cache_path)  # nothing left to remove
+
+
+def test_clear_failure_is_a_warning(tmp_path, monkeypatch, capsys):
+    def refuse(path=metaspy.CACHE_PATH):
+        raise PermissionError(13, "Permission denied", path)
+    unsupported = tmp_path / "notes.txt"
+    unsupported.write_text("x")
+    monkeypatch.setattr(metaspy, "clear_cache", refuse)
+    monkeypatch.setattr("sys.argv", ["metaspy.py", "--clear-cache", "--no-cache", str(unsupported)])
+    metaspy.main()
+    assert "Could not clear the metadata cache" in capsys.readouterr().out
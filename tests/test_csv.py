@@ -0,0 +1,41 @@
+"""Checks that the CSV report matches the csv.DictWriter report it replaced."""
+
+import csv
+
+import metaspy
+
+
+DATA = [
+    {"file": "a.pdf", "metadata": {"Title": "x, \"quoted\"", "Author": None, "CreationDate": "2024-01-31"}},
+    {"file": "b.jpg", "metadata": {"Make": "Canon", "GPSLatitude": 1.5}, "Geolocation": "https://maps/?q=1.5,2"},
+    {"file": "c.docx", "metadata": {"Error": "Could not process DOCX: boom", "File": "shadowed"}},
+]
+
+
+def dictwriter_report(data, path):
+    """The original save_as_csv: one dict per row, fields sorted."""
+    rows = []
+    for item in data:
+        row = {"File": item["file"]}
+        if "Geolocation" in item:
+            row["Geolocation"] = item["Geolocation"]
+        row.update(item["metadata"])
+        rows.append(row)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=sorted({key for row in rows for key in row}))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def test_matches_dictwriter_output(tmp_path):
+    expected, actual = tmp_path / "expected.csv", tmp_path / "actual.csv"
+    dictwriter_report(DATA, expected)
+    metaspy.save_as_csv(DATA, str(actual))
+    assert actual.read_bytes() == expected.read_bytes()
+
+
+def test_empty_report(tmp_path, capsys):
+    path = tmp_path / "empty.csv"
+    metaspy.save_as_csv([], str(path))
+    assert path.read_bytes() == b""
+    assert "No data to write" in capsys.readouterr().out
@@ -0,0 +1,45 @@
+"""Checks how main() schedules extraction."""
+
+import zipfile
+
+import metaspy
+
+
+def write_docx(path, title):
+    with zipfile.ZipFile(path, "w") as z:
+        z.writestr(
+            "docProps/core.xml",
+            '<cp:coreProperties xmlns:cp="http://schemas.openxmlformats.org/package/2006/metadata/core-properties"'
+            f' xmlns:dc="http://purl.org/dc/elements/1.1/"><dc:title>{title}</dc:title></cp:coreProperties>',
+        )
+    return str(path)
+
+
+def run(monkeypatch, *argv):
+    monkeypatch.setattr("sys.argv", ["metaspy.py", "--no-cache", *argv])
+    metaspy.main()
+
+
+def test_single_document_is_extracted_without_a_pool(tmp_path, monkeypatch, capsys):
+    def no_pool(*args, **kwargs):
+        raise AssertionError("worker pool started for a single document")
+    monkeypatch.setattr(metaspy, "ProcessPoolExecutor", no_pool)
+
+    run(monkeypatch, write_docx(tmp_path / "only.docx", "Solo"))
+    assert "Title: Solo" in capsys.readouterr().out
+
+
+def test_single_document_failure_is_reported(tmp_path, monkeypatch, capsys):
+    def explode(path):
+        raise RuntimeError("boom")
+    monkeypatch.setitem(metaspy.FILE_HANDLERS, "docx", explode)
+
+    run(monkeypatch, write_docx(tmp_path / "only.docx", "Solo"))
+    assert "Error: Unexpected error (RuntimeError): boom" in capsys.readouterr().out
+
+
+def test_several_documents_keep_input_order(tmp_path, monkeypatch, capsys):
+    paths = [write_docx(tmp_path / f"{name}.docx", name) for name in ("b", "a", "c")]
+    run(monkeypatch, *paths)
+    out = capsys.readouterr().out
+    assert out.index("Title: b") < out.index("Title: a") < out.index("Title: c")
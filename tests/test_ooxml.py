@@ -0,0 +1,102 @@
+"""Checks the OOXML core.xml reader against what python-docx and openpyxl reported.
+
+The expected field values are what python-docx, python-pptx and openpyxl
+(which metaspy used before reading docProps/core.xml itself) gave for the
+same core.xml.
+"""
+
+import zipfile
+
+import pytest
+
+import metaspy
+
+
+CORE_XML = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<cp:coreProperties xmlns:cp="http://schemas.openxmlformats.org/package/2006/metadata/core-properties"
+    xmlns:dc="http://purl.org/dc/elements/1.1/" xmlns:dcterms="http://purl.org/dc/terms/"
+    xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">{}</cp:coreProperties>"""
+
+FULL = (
+    "<dc:title>  Padded title  </dc:title><dc:subject>\nsubj\n</dc:subject>"
+    "<dc:creator>Jane</dc:creator><cp:lastModifiedBy>Bob</cp:lastModifiedBy><cp:revision>3</cp:revision>"
+    '<dcterms:created xsi:type="dcterms:W3CDTF">2024-01-31T12:00:00Z</dcterms:created>'
+    '<dcterms:modified xsi:type="dcterms:W3CDTF">2024-01-31T23:30:00-08:00</dcterms:modified>'
+)
+
+
+def write_package(tmp_path, ext, properties):
+    path = tmp_path / f"sample.{ext}"
+    with zipfile.ZipFile(path, "w") as z:
+        z.writestr("docProps/core.xml", CORE_XML.format(properties))
+    return str(path)
+
+
+def read(path, ext):
+    return metaspy.FILE_HANDLERS[ext](path)
+
+
+@pytest.mark.parametrize("ext", ["docx", "pptx"])
+def test_document_fields(tmp_path, ext):
+    assert read(write_package(tmp_path, ext, FULL), ext) == {
+        "File Type": ext.upper(),
+        "Author": "Jane",
+        "Last Modified By": "Bob",
+        "Revision": 3,
+        "Created": "2024-01-31 12:00:00",
+        "Modified": "2024-02-01 07:30:00",
+        "Title": "  Padded title  ",
+        "Subject": "\nsubj\n",
+    }
+
+
+def test_workbook_fields_ignore_utc_offset(tmp_path):
+    assert read(write_package(tmp_path, "xlsx", FULL), "xlsx") == {
+        "File Type": "XLSX",
+        "Creator": "Jane",
+        "Last Modified By": "Bob",
+        "Created": "2024-01-31 12:00:00",
+        "Modified": "2024-01-31 23:30:00",
+        "Title": "  Padded title  ",
+        "Subject": "\nsubj\n",
+    }
+
+
+def test_missing_properties_use_library_defaults(tmp_path):
+    assert read(write_package(tmp_path, "docx", ""), "docx") == {
+        "File Type": "DOCX",
+        "Author": "",
+        "Last Modified By": "",
+        "Revision": 0,
+        "Created": None,
+        "Modified": None,
+        "Title": "",
+        "Subject": "",
+    }
+    assert read(write_package(tmp_path, "xlsx", ""), "xlsx") == {
+        "File Type": "XLSX",
+        "Creator": None,
+        "Last Modified By": None,
+        "Created": None,
+        "Modified": None,
+        "Title": None,
+        "Subject": None,
+    }
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("2024", "2024-01-01 00:00:00"),
+    ("2024-02", "2024-02-01 00:00:00"),
+    ("2024-02-03", "2024-02-03 00:00:00"),
+    ("2024-01-31T12:00:00.250Z", "2024-01-31 12:00:00"),
+    ("2024-01-31T12:00:00+05:30", "2024-01-31 06:30:00"),
+    ("garbage", None),
+])
+def test_w3cdtf_forms(text, expected):
+    assert metaspy._ooxml_datetime(text) == expected
+
+
+def test_bad_archive_is_reported(tmp_path):
+    path = tmp_path / "broken.docx"
+    path.write_bytes(b"not a zip")
+    assert read(str(path), "docx") == {"Error": "Could not process DOCX: File is not a zip file"}
@@ -0,0 +1,156 @@
+"""Checks the minimal PDF Info reader against pypdf.
+
+Every fixture is either read by the fast reader with the same result pypdf
+gives, or rejected with _PdfParseError so extract_pdf_metadata falls back
+to pypdf and reports exactly what a pypdf-only run would.
+"""
+
+import io
+
+import pytest
+
+pypdf = pytest.importorskip("pypdf")
+
+import metaspy
+
+
+CATALOG = b"<< /Type /Catalog /Pages 2 0 R >>"
+PAGES = b"<< /Type /Pages /Kids [] /Count 0 >>"
+
+
+def build_pdf(info, xref="table", extra_objects=(), trailer_extra=b""):
+    """Builds a PDF whose object 3 is the Info dictionary, with a classic or stream xref."""
+    objects = [CATALOG, PAGES, info, *extra_objects]
+    out = bytearray(b"%PDF-1.7\n")
+    offsets = []
+    for num, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (num, body)
+    size = len(objects) + 1
+    xref_at = len(out)
+    if xref == "table":
+        out += b"xref\n0 %d\n0000000000 65535 f \n" % size
+        out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+        out += b"trailer\n<< /Size %d /Root 1 0 R /Info 3 0 R %s>>\n" % (size, trailer_extra)
+    else:
+        rows = b"\x00\x00\x00\xff"
+        rows += b"".join(b"\x01" + offset.to_bytes(2, "big") + b"\x00" for offset in offsets + [xref_at])
+        out += (
+            b"%d 0 obj\n<< /Type /XRef /Size %d /W [1 2 1] /Root 1 0 R /Info 3 0 R /Length %d >>\nstream\n"
+            % (size, size + 1, len(rows))
+        )
+        out += rows + b"\nendstream\nendobj\n"
+    out += b"startxref\n%d\n%%%%EOF\n" % xref_at
+    return bytes(out)
+
+
+def append_update(data, objects, trailer_keys=b"/Info 3 0 R"):
+    """Appends an incremental update (classic xref section chained with /Prev)."""
+    prev = int(data.rsplit(b"startxref", 1)[1].split()[0])
+    out = bytearray(data)
+    offsets = {}
+    for num, body in objects.items():
+        offsets[num] = len(out)
+        out += b"%d 0 obj\n%s\nendobj\n" % (num, body)
+    xref_at = len(out)
+    out += b"xref\n"
+    for num, offset in sorted(offsets.items()):
+        out += b"%d 1\n%010d 00000 n \n" % (num, offset)
+    size = max(4, max(offsets) + 1)
+    out += b"trailer\n<< /Size %d /Root 1 0 R %s /Prev %d >>\n" % (size, trailer_keys, prev)
+    out += b"startxref\n%d\n%%%%EOF\n" % xref_at
+    return bytes(out)
+
+
+PLAIN = build_pdf(
+    b"<< /Title (Plain \\(escaped\\) title \\200) /Author (Jane\\040Doe) /Producer (p)"
+    b" /CreationDate (D:20240131120000+01'00') /ModDate (D:2023) >>"
+)
+HEX_AND_UTF16 = build_pdf(
+    b"<< /Title <FEFF00520065007300FC006D00E9> /Author <48 65 6C 6C 6F>"
+    b" /Creator (\\376\\377\\000O\\000K) /Keywords [ (a) /b << /c 1 >> ] % comment\n"
+    b" /Producer (multi\\\nline) >>"
+)
+INCREMENTAL_NEW_INFO = append_update(PLAIN, {3: b"<< /Title (Updated) /Author (Second) >>"})
+INCREMENTAL_OLD_INFO = append_update(PLAIN, {4: b"<< /Unrelated true >>"})
+# The update trailer omits /Info, which is then inherited from the older trailer.
+INCREMENTAL_INHERITED_INFO = append_update(PLAIN, {4: b"<< /Unrelated true >>"}, trailer_keys=b"")
+
+FAST_CASES = {
+    "plain": PLAIN,
+    "hex_and_utf16": HEX_AND_UTF16,
+    "incremental_new_info": INCREMENTAL_NEW_INFO,
+    "incremental_old_info": INCREMENTAL_OLD_INFO,
+    "incremental_inherited_info": INCREMENTAL_INHERITED_INFO,
+}
+
+
+def encrypted_pdf():
+    writer = pypdf.PdfWriter()
+    writer.add_blank_page(10, 10)
+    writer.add_metadata({"/Title": "secret"})
+    writer.encrypt("pw")
+    stream = io.BytesIO()
+    writer.write(stream)
+    return stream.getvalue()
+
+
+FALLBACK_CASES = {
+    "xref_stream": build_pdf(b"<< /Title (Streamed) >>", xref="stream"),
+    "indirect_value": build_pdf(b"<< /Title 4 0 R >>", extra_objects=[b"(Indirect)"]),
+    "name_value": build_pdf(b"<< /Title /Foo /Author 42 >>"),
+    "bad_date": build_pdf(b"<< /Title (x) /CreationDate (D:2024ZZ) >>"),
+    "truncated_startxref": PLAIN.rsplit(b"startxref", 1)[0] + b"startxref\n\n%%EOF\n",
+    "bad_startxref_offset": PLAIN.rsplit(b"startxref", 1)[0] + b"startxref\n999999\n%%EOF\n",
+    "encrypt_in_older_trailer": append_update(
+        build_pdf(
+            b"<< /Title <8a7f3c> >>",
+            extra_objects=[b"<< /Filter /Standard /V 1 /R 2 /O <00> /U <00> /P -4 >>"],
+            trailer_extra=b"/Encrypt 4 0 R ",
+        ),
+        {5: b"<< /Unrelated true >>"},
+    ),
+    "encrypted": None,  # built lazily: pypdf's writer is only needed for this one
+}
+
+
+def write_fixture(tmp_path, name, data):
+    if data is None:
+        data = encrypted_pdf()
+    path = tmp_path / f"{name}.pdf"
+    path.write_bytes(data)
+    return path
+
+
+def pypdf_only(path, monkeypatch):
+    """extract_pdf_metadata as it behaves when the fast reader gives up."""
+    def give_up(buf):
+        raise metaspy._PdfParseError("forced fallback")
+    with monkeypatch.context() as patch:
+        patch.setattr(metaspy, "_read_pdf_info_fast", give_up)
+        return metaspy.extract_pdf_metadata(str(path))
+
+
+@pytest.mark.parametrize("name", FAST_CASES)
+def test_fast_reader_matches_pypdf(name, tmp_path, monkeypatch):
+    data = FAST_CASES[name]
+    assert metaspy._read_pdf_info_fast(data) == metaspy._read_pdf_info_pypdf(io.BytesIO(data))
+
+    path = write_fixture(tmp_path, name, data)
+    assert metaspy.extract_pdf_metadata(str(path)) == pypdf_only(path, monkeypatch)
+
+
+@pytest.mark.parametrize("name", FALLBACK_CASES)
+def test_unsupported_layouts_fall_back_to_pypdf(name, tmp_path, monkeypatch):
+    path = write_fixture(tmp_path, name, FALLBACK_CASES[name])
+    with pytest.raises(metaspy._PdfParseError):
+        metaspy._read_pdf_info_fast(path.read_bytes())
+
+    assert metaspy.extract_pdf_metadata(str(path)) == pypdf_only(path, monkeypatch)
+
+
+def test_fallback_errors_are_reported_as_pdf_errors(tmp_path):
+    path = write_fixture(tmp_path, "bad_date", FALLBACK_CASES["bad_date"])
+    assert metaspy.extract_pdf_metadata(str(path)) == {
+        "Error": "Could not process PDF: Can not convert date: D:2024ZZ"
+    }
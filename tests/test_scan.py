@@ -0,0 +1,46 @@
+"""Checks how directory arguments are expanded into files."""
+
+import os
+import sys
+
+import pytest
+
+import metaspy
+
+
+def touch(path, data=b""):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return path
+
+
+def test_supported_files_in_name_order(tmp_path):
+    touch(tmp_path / "b.PDF", b"12345")
+    touch(tmp_path / "a.docx")
+    touch(tmp_path / "notes.txt")
+    touch(tmp_path / "sub" / "deep" / "photo.jpg")
+    touch(tmp_path / "sub" / "c.xlsx")
+    (tmp_path / "empty").mkdir()
+
+    found = list(metaspy._scan_directory(str(tmp_path)))
+    assert [os.path.relpath(path, tmp_path) for path, _ in found] == [
+        "a.docx",
+        "b.PDF",
+        os.path.join("sub", "c.xlsx"),
+        os.path.join("sub", "deep", "photo.jpg"),
+    ]
+    assert found[1][1].st_size == 5
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="needs symlink support")
+def test_symlinked_directories_are_not_followed(tmp_path):
+    touch(tmp_path / "real" / "a.pdf")
+    (tmp_path / "link").symlink_to(tmp_path / "real", target_is_directory=True)
+
+    found = [path for path, _ in metaspy._scan_directory(str(tmp_path))]
+    assert found == [str(tmp_path / "real" / "a.pdf")]
+
+
+def test_unreadable_directory_is_a_warning(tmp_path, capsys):
+    assert list(metaspy._scan_directory(str(tmp_path / "missing"))) == []
+    assert "Could not read directory" in capsys.readouterr().out